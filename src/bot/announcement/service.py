@@ -3,6 +3,7 @@
 
 import datetime
 import logging
+from functools import lru_cache
 from string import Template
 
 import discord
@@ -21,6 +22,30 @@ REACTION_LEGEND = (
     f"{ReactionEmoji.REST}: おやすみ"
 )
 
+# テンプレートで利用できる変数名 (`_template_vars` はこの順に値を対応付ける)
+_TEMPLATE_VAR_NAMES = (
+    "month",
+    "day",
+    "weekday",
+    "time",
+    "url",
+    "speaker_name",
+    "title",
+)
+
+
+@lru_cache(maxsize=32)
+def _get_template(template_str: str) -> Template:
+    """テンプレート文字列に対応する `Template` を返す（同一文字列は使い回す）。
+
+    Args:
+        template_str: `string.Template` 形式のテンプレート文字列
+
+    Returns:
+        コンパイル済みのテンプレート
+    """
+    return Template(template_str)
+
 
 class AnnouncementService:
     """告知サービスクラス。
@@ -45,32 +70,63 @@ class AnnouncementService:
         self.config = config
         self.state = state
         self.clock = clock or SystemClock()
+        self._validate_templates()
+
+    def _validate_templates(self) -> None:
+        """`[templates]` の各テンプレートを起動時に 1 度だけ検証する。
 
-    def next_event_date(self) -> datetime.date:
+        書式エラーや未知の変数は展開時に黙って残るため、ここで警告を出しておく。
+        """
+        template_keys = [
+            *ConfigKeys.ANNOUNCE_TEMPLATE_KEYS.values(),
+            *ConfigKeys.OPEN_TEMPLATE_KEYS.values(),
+        ]
+        for key in template_keys:
+            template = _get_template(
+                self.config.get(ConfigKeys.SECTION_TEMPLATES, key, "")
+            )
+            if not template.is_valid():
+                self.logger.warning("テンプレート %s の書式が不正です", key)
+                continue
+            unknown = set(template.get_identifiers()).difference(_TEMPLATE_VAR_NAMES)
+            if unknown:
+                self.logger.warning(
+                    "テンプレート %s に未知の変数があります: %s",
+                    key,
+                    ", ".join(sorted(unknown)),
+                )
+
+    def next_event_date(self, today: datetime.date | None = None) -> datetime.date:
         """次の開催日（設定された開催曜日）の日付を返す。
 
+        Args:
+            today: 基準日（未指定なら Clock の当日）
+
         Returns:
             次の開催曜日の日付
         """
         event_weekday = self.config.get(
             ConfigKeys.SECTION_SETTINGS, ConfigKeys.KEY_EVENT_WEEKDAY, Weekday.WEDNESDAY
         )
-        return self._next_weekday(event_weekday)
+        return self._next_weekday(event_weekday, today)
 
-    def _next_weekday(self, weekday_str: str) -> datetime.date:
+    def _next_weekday(
+        self, weekday_str: str, today: datetime.date | None = None
+    ) -> datetime.date:
         """指定曜日の次の日付を返す（当日を含まず最短の未来日）。
 
         Args:
             weekday_str: 3文字の曜日略称（例: 'Wed'）
+            today: 基準日（未指定なら Clock の当日）
 
         Returns:
             次の該当曜日の日付
         """
         target_weekday = Weekday.to_int(weekday_str)
-        today = self.clock.today()
-        days_ahead = target_weekday - today.weekday()
-        if days_ahead <= 0:
-            days_ahead += 7
+        if today is None:
+            today = self.clock.today()
+        # 当日を含まないため 1〜7 日先に写像する
+        days_ahead = (target_weekday - today.weekday() - 1) % 7 + 1
         return today + datetime.timedelta(days=days_ahead)
 
     def _template_vars(self, target_date: datetime.date) -> dict[str, object]:
@@ -89,29 +145,49 @@ class AnnouncementService:
             ConfigKeys.SECTION_SETTINGS, ConfigKeys.KEY_EVENT_TIME, "21:30"
         )
         lt = self.state.state.lt
-        return {
-            "month": target_date.month,
-            "day": target_date.day,
-            "weekday": Weekday.to_jp(target_date.weekday()),
-            "time": event_time,
-            "url": lt.url or default_url,
-            "speaker_name": lt.speaker_name or "発表者未定",
-            "title": lt.title or "タイトル未定",
-        }
-
-    def build_announce(self, announcement_type: AnnouncementType) -> str:
+        values = (
+            target_date.month,
+            target_date.day,
+            Weekday.to_jp(target_date.weekday()),
+            event_time,
+            lt.url or default_url,
+            lt.speaker_name or "発表者未定",
+            lt.title or "タイトル未定",
+        )
+        return dict(zip(_TEMPLATE_VAR_NAMES, values, strict=True))
+
+    def _render(self, template_key: str, event_date: datetime.date) -> str:
+        """`[templates]` の指定キーのテンプレートを開催日で展開する。
+
+        Args:
+            template_key: テンプレートの設定キー
+            event_date: 文面に埋め込む開催日
+
+        Returns:
+            展開済みのメッセージ本文
+        """
+        template_str = self.config.get(ConfigKeys.SECTION_TEMPLATES, template_key, "")
+        return _get_template(template_str).safe_substitute(
+            self._template_vars(event_date)
+        )
+
+    def build_announce(
+        self,
+        announcement_type: AnnouncementType,
+        event_date: datetime.date | None = None,
+    ) -> str:
         """初回告知メッセージ（公開チャンネル向け本文）を生成する。
 
         Args:
             announcement_type: 今週の開催種別
+            event_date: 開催日（未指定なら `next_event_date()`）
 
         Returns:
             送信用のメッセージ本文
         """
-        template_key = ConfigKeys.ANNOUNCE_TEMPLATE_KEYS[announcement_type]
-        template_str = self.config.get(ConfigKeys.SECTION_TEMPLATES, template_key, "")
-        return Template(template_str).safe_substitute(
-            self._template_vars(self.next_event_date())
+        return self._render(
+            ConfigKeys.ANNOUNCE_TEMPLATE_KEYS[announcement_type],
+            event_date or self.next_event_date(),
         )
 
     def build_confirm(self, announcement_type: AnnouncementType) -> str:
@@ -125,11 +201,16 @@ class AnnouncementService:
         """
         return f"今週は「{announcement_type}」で告知しました。{REACTION_LEGEND}"
 
-    def build_open(self, announcement_type: AnnouncementType) -> str | None:
+    def build_open(
+        self,
+        announcement_type: AnnouncementType,
+        event_date: datetime.date | None = None,
+    ) -> str | None:
         """開催告知メッセージを生成する。
 
         Args:
             announcement_type: 今週の開催種別
+            event_date: 開催日（未指定なら `next_event_date()`）
 
         Returns:
             送信用のメッセージ本文。おやすみ（REST）の場合は None
@@ -137,13 +218,12 @@ class AnnouncementService:
         template_key = ConfigKeys.OPEN_TEMPLATE_KEYS.get(announcement_type)
         if template_key is None:
             return None
-        template_str = self.config.get(ConfigKeys.SECTION_TEMPLATES, template_key, "")
-        return Template(template_str).safe_substitute(
-            self._template_vars(self.next_event_date())
-        )
+        return self._render(template_key, event_date or self.next_event_date())
 
     async def send_announce(
-        self, channel: discord.TextChannel | None
+        self,
+        channel: discord.TextChannel | None,
+        event_date: datetime.date | None = None,
     ) -> discord.Message | None:
         """初回告知を公開チャンネルへ送信し、状態を更新する。
 
@@ -151,6 +231,7 @@ class AnnouncementService:
 
         Args:
             channel: 送信先の公開告知チャンネル
+            event_date: 開催日（未指定なら `next_event_date()`）
 
         Returns:
             送信されたメッセージ、または送信失敗時は None
@@ -159,21 +240,23 @@ class AnnouncementService:
             self.logger.error("初回告知を送信できません: チャンネルがNoneです")
             return None
 
+        if event_date is None:
+            event_date = self.next_event_date()
         session_type = self.state.state.session_type
-        content = self.build_announce(session_type)
+        content = self.build_announce(session_type, event_date)
         try:
             message = await channel.send(content)
             self.logger.info(
-                f"初回告知({session_type})を {channel.name} に送信しました"
+                "初回告知(%s)を %s に送信しました", session_type, channel.name
             )
 
             # 再投稿時に削除対象を特定するため記録し永続化
             self.state.state.announce_message_id = message.id
-            self.state.state.target_event_date = self.next_event_date()
-            self.state.save()
+            self.state.state.target_event_date = event_date
+            await self.state.save_async()
             return message
         except discord.DiscordException as e:
-            self.logger.error(f"初回告知の送信に失敗しました: {e}")
+            self.logger.error("初回告知の送信に失敗しました: %s", e)
             return None
 
     async def send_confirm(
@@ -197,7 +280,7 @@ class AnnouncementService:
         content = f"{mention} {body}" if mention else body
         try:
             message = await channel.send(content)
-            self.logger.info(f"確認報告を {channel.name} に送信しました")
+            self.logger.info("確認報告を %s に送信しました", channel.name)
 
             for emoji in (
                 ReactionEmoji.REGULAR,
@@ -209,10 +292,10 @@ class AnnouncementService:
 
             # 種別変更リアクションの対象メッセージとして記録し永続化
             self.state.state.confirm_message_id = message.id
-            self.state.save()
+            await self.state.save_async()
             return message
         except discord.DiscordException as e:
-            self.logger.error(f"確認報告の送信に失敗しました: {e}")
+            self.logger.error("確認報告の送信に失敗しました: %s", e)
             return None
 
     async def reannounce(
@@ -240,7 +323,7 @@ class AnnouncementService:
             old_message = await channel.fetch_message(message_id)
             await old_message.delete()
         except discord.DiscordException as e:
-            self.logger.warning(f"旧告知の削除に失敗しました（続行）: {e}")
+            self.logger.warning("旧告知の削除に失敗しました（続行）: %s", e)
 
         return await self.send_announce(channel)
 
@@ -269,9 +352,9 @@ class AnnouncementService:
         try:
             message = await channel.send(content)
             self.logger.info(
-                f"開催告知({session_type})を {channel.name} に送信しました"
+                "開催告知(%s)を %s に送信しました", session_type, channel.name
             )
             return message
         except discord.DiscordException as e:
-            self.logger.error(f"開催告知の送信に失敗しました: {e}")
+            self.logger.error("開催告知の送信に失敗しました: %s", e)
             return None
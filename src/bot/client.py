@@ -1,6 +1,8 @@
 # src/bot/client.py
 """Discord Botのメインクライアントモジュール。"""
 
+import hashlib
+import json
 import logging
 import os
 from typing import override
@@ -32,8 +34,8 @@ class AnnounceBotClient(commands.Bot):
 
     def __init__(self):
         """Botクライアントを初期化する。"""
+        # コマンドはスラッシュコマンドのみで本文を読まないため message_content は不要
         intents = discord.Intents.default()
-        intents.message_content = True
         intents.members = True
         intents.reactions = True
 
@@ -68,9 +70,41 @@ class AnnounceBotClient(commands.Bot):
         self.logger.info("コマンド拡張を読み込みました")
 
         self.schedule_announce_task()
-        await self.tree.sync()
+        await self._sync_command_tree()
         self.logger.info("Botのセットアップが完了しました")
 
+    def _command_tree_hash(self) -> str:
+        """現在のスラッシュコマンド定義 (アプリケーション ID 込み) のハッシュを返す。
+
+        Returns:
+            コマンド定義の SHA-256 ハッシュ (16 進文字列)
+        """
+        payload = {
+            "application_id": self.application_id,
+            "commands": [
+                command.to_dict(self.tree) for command in self.tree.get_commands()
+            ],
+        }
+        encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    async def _sync_command_tree(self) -> None:
+        """コマンド定義が前回の sync から変わっている場合のみツリーを sync する。
+
+        `tree.sync()` はレート制限の厳しい API 呼び出しのため、再起動のたびには行わない。
+        環境変数 `FORCE_COMMAND_SYNC` が空でなければハッシュに関わらず sync する。
+        """
+        tree_hash = self._command_tree_hash()
+        force = bool(os.getenv(EnvKeys.FORCE_COMMAND_SYNC))
+        if not force and self.state.state.command_tree_hash == tree_hash:
+            self.logger.info("コマンド定義に変更が無いため sync を省略しました")
+            return
+
+        await self.tree.sync()
+        self.state.state.command_tree_hash = tree_hash
+        await self.state.save_async()
+        self.logger.info("コマンドツリーを sync しました")
+
     def schedule_announce_task(self) -> None:
         """初回告知の週次スケジュールタスクを (再)登録する。"""
         weekday = self.config.get(
@@ -150,10 +184,10 @@ class AnnounceBotClient(commands.Bot):
             self.state.state.session_type = AnnouncementType.REGULAR
             self.state.state.lt.clear()
             self.state.state.target_event_date = event_date
-            self.state.save()
-            self.logger.info(f"新しい開催週({event_date})の予定を初期化しました")
+            await self.state.save_async()
+            self.logger.info("新しい開催週(%s)の予定を初期化しました", event_date)
 
-        await self.announcement_service.send_announce(channel)
+        await self.announcement_service.send_announce(channel, event_date)
 
         # 確認チャンネルへ報告 (運営がリアクションで種別変更できる)
         confirm_channel = self.get_confirm_channel()
@@ -173,10 +207,10 @@ class AnnounceBotClient(commands.Bot):
 
     async def on_ready(self) -> None:
         """Botの準備完了時に呼ばれるイベントハンドラ。"""
-        self.logger.info(f"Botの準備が完了しました! ログイン: {self.user}")
+        self.logger.info("Botの準備が完了しました! ログイン: %s", self.user)
         guild_names = [guild.name for guild in self.guilds]
         self.logger.info(
-            f"{len(guild_names)}個のギルドに接続しています: {', '.join(guild_names)}"
+            "%s個のギルドに接続しています: %s", len(guild_names), ", ".join(guild_names)
         )
 
     def _has_moderator_role(self, member: discord.Member) -> bool:
@@ -188,14 +222,10 @@ class AnnounceBotClient(commands.Bot):
         Returns:
             権限がある場合は True
         """
-        admin_roles = self.config.get(
-            ConfigKeys.SECTION_PERMISSIONS, ConfigKeys.KEY_ADMIN_ROLES, []
-        )
-        moderator_roles = self.config.get(
-            ConfigKeys.SECTION_PERMISSIONS, ConfigKeys.KEY_MODERATOR_ROLES, []
+        allowed = self.config.role_names(
+            ConfigKeys.KEY_ADMIN_ROLES, ConfigKeys.KEY_MODERATOR_ROLES
         )
-        allowed = set(admin_roles) | set(moderator_roles)
-        return any(role.name in allowed for role in member.roles)
+        return not allowed.isdisjoint(role.name for role in member.roles)
 
     async def on_raw_reaction_add(
         self, payload: discord.RawReactionActionEvent
@@ -226,9 +256,9 @@ class AnnounceBotClient(commands.Bot):
             return
 
         self.state.state.session_type = announcement_type
-        self.state.save()
+        await self.state.save_async()
         self.logger.info(
-            f"ユーザー {member} が種別を {announcement_type} に変更しました"
+            "ユーザー %s が種別を %s に変更しました", member, announcement_type
         )
 
         # 公開告知を新しい種別で再投稿
@@ -0,0 +1,11 @@
+# src/bot/commands/choices.py
+"""複数のコマンドで共有するオートコンプリート候補を定義するモジュール。"""
+
+from discord import app_commands
+
+from ..constants import TYPE_BY_SLUG
+
+# 種別スラッグのオートコンプリート候補 (スラッグは小文字)
+TYPE_CHOICES = tuple(
+    app_commands.Choice(name=slug, value=slug) for slug in TYPE_BY_SLUG
+)
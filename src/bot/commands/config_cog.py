@@ -2,7 +2,6 @@
 """Bot設定管理のためのコマンドモジュール。"""
 
 import logging
-import re
 
 import discord
 from discord import app_commands
@@ -12,7 +11,33 @@ from ..client import AnnounceBotClient
 from ..constants import ConfigKeys, Weekday
 from .permissions import is_admin
 
-_TIME_PATTERN = re.compile(r"^([01]?[0-9]|2[0-3]):([0-5][0-9])$")
+_INVALID_DAY_MESSAGE = f"無効な曜日形式です。有効な値: {', '.join(Weekday.ALL)}"
+_INVALID_TIME_MESSAGE = "無効な時間形式です。HH:MM形式で入力してください。"
+_NO_PERMISSION_MESSAGE = "設定を変更する権限がありません。"
+_NO_PERMISSION_RESET_MESSAGE = "設定をリセットする権限がありません。"
+
+# 曜日オートコンプリートの選択肢 (小文字化した曜日名との組)
+_DAY_CHOICES = tuple(
+    (day.lower(), app_commands.Choice(name=day, value=day)) for day in Weekday.ALL
+)
+
+
+def _is_valid_time(time: str) -> bool:
+    """HH:MM 形式 (時は 1〜2 桁、分は 2 桁) の有効な時刻か判定する。
+
+    Args:
+        time: 判定する文字列
+
+    Returns:
+        有効な時刻なら True
+    """
+    hour, sep, minute = time.partition(":")
+    if not sep or len(hour) not in (1, 2) or len(minute) != 2:
+        return False
+    digits = hour + minute
+    if not (digits.isascii() and digits.isdigit()):
+        return False
+    return int(hour) <= 23 and int(minute) <= 59
 
 
 class ConfigCog(commands.Cog):
@@ -40,53 +65,111 @@ class ConfigCog(commands.Cog):
         Returns:
             エラーメッセージ。問題なければ None
         """
-        if day not in Weekday.ALL:
-            return f"無効な曜日形式です。有効な値: {', '.join(Weekday.ALL)}"
-        if not _TIME_PATTERN.match(time):
-            return "無効な時間形式です。HH:MM形式で入力してください。"
+        if day not in Weekday.MAP_TO_INT:
+            return _INVALID_DAY_MESSAGE
+        if not _is_valid_time(time):
+            return _INVALID_TIME_MESSAGE
         return None
 
-    config_group = app_commands.Group(name="config", description="ボットの設定を管理")
-
-    @config_group.command(name="announce")
-    @app_commands.describe(
-        day="初回告知の曜日 (Mon, Tue, ..., Sun)",
-        time="初回告知の時刻 (HH:MM形式)",
-    )
-    async def config_announce(
-        self, interaction: discord.Interaction, day: str, time: str
-    ):
-        """初回告知の曜日と時刻を設定する。
+    async def _set_day_time(
+        self,
+        interaction: discord.Interaction,
+        keys: tuple[str, str],
+        day: str,
+        time: str,
+        label: str,
+    ) -> bool:
+        """権限と入力を確認し、`[settings]` の曜日・時刻を設定する。
 
         Args:
             interaction: コマンドインタラクション
+            keys: 曜日と時刻の設定キーの組
             day: 設定する曜日（3文字略称）
             time: 設定する時刻（HH:MM形式）
+            label: 応答に使う設定の表示名
+
+        Returns:
+            設定した場合は True
         """
         if not is_admin(interaction, self.bot.config):
             await interaction.response.send_message(
-                "設定を変更する権限がありません。", ephemeral=True
+                _NO_PERMISSION_MESSAGE, ephemeral=True
             )
-            return
+            return False
 
         error = self._validate_day_time(day, time)
         if error:
             await interaction.response.send_message(error, ephemeral=True)
-            return
+            return False
 
-        self.bot.config.set(
-            ConfigKeys.SECTION_SETTINGS, ConfigKeys.KEY_ANNOUNCE_WEEKDAY, day
+        weekday_key, time_key = keys
+        self.bot.config.set_many(
+            ConfigKeys.SECTION_SETTINGS, {weekday_key: day, time_key: time}
         )
-        self.bot.config.set(
-            ConfigKeys.SECTION_SETTINGS, ConfigKeys.KEY_ANNOUNCE_TIME, time
+        await interaction.response.send_message(
+            f"{label}を {day} {time} に設定しました。", ephemeral=True
         )
-        # スケジュールタスクを再登録
-        self.bot.schedule_announce_task()
+        return True
+
+    async def _get_or_set_channel(
+        self,
+        interaction: discord.Interaction,
+        key: str,
+        channel: discord.TextChannel | None,
+        label: str,
+    ) -> None:
+        """`[channels]` のチャンネルを取得 (channel が None) または設定する。
+
+        Args:
+            interaction: コマンドインタラクション
+            key: チャンネルIDの設定キー
+            channel: 設定するチャンネル、またはNoneで現在の値を取得
+            label: 応答に使うチャンネルの表示名
+        """
+        if channel is None:
+            await interaction.response.send_message(
+                f"現在の{label}: {self._channel_name(key)}", ephemeral=True
+            )
+            return
 
+        if not is_admin(interaction, self.bot.config):
+            await interaction.response.send_message(
+                _NO_PERMISSION_MESSAGE, ephemeral=True
+            )
+            return
+
+        self.bot.config.set(ConfigKeys.SECTION_CHANNELS, key, str(channel.id))
         await interaction.response.send_message(
-            f"初回告知を {day} {time} に設定しました。", ephemeral=True
+            f"{label}を {channel.name} に設定しました。", ephemeral=True
         )
 
+    config_group = app_commands.Group(name="config", description="ボットの設定を管理")
+
+    @config_group.command(name="announce")
+    @app_commands.describe(
+        day="初回告知の曜日 (Mon, Tue, ..., Sun)",
+        time="初回告知の時刻 (HH:MM形式)",
+    )
+    async def config_announce(
+        self, interaction: discord.Interaction, day: str, time: str
+    ):
+        """初回告知の曜日と時刻を設定する。
+
+        Args:
+            interaction: コマンドインタラクション
+            day: 設定する曜日（3文字略称）
+            time: 設定する時刻（HH:MM形式）
+        """
+        if await self._set_day_time(
+            interaction,
+            (ConfigKeys.KEY_ANNOUNCE_WEEKDAY, ConfigKeys.KEY_ANNOUNCE_TIME),
+            day,
+            time,
+            "初回告知",
+        ):
+            # スケジュールタスクを再登録
+            self.bot.schedule_announce_task()
+
     @config_group.command(name="event")
     @app_commands.describe(
         day="開催の曜日 (Mon, Tue, ..., Sun)",
@@ -100,26 +183,12 @@ class ConfigCog(commands.Cog):
             day: 設定する曜日（3文字略称）
             time: 設定する時刻（HH:MM形式）
         """
-        if not is_admin(interaction, self.bot.config):
-            await interaction.response.send_message(
-                "設定を変更する権限がありません。", ephemeral=True
-            )
-            return
-
-        error = self._validate_day_time(day, time)
-        if error:
-            await interaction.response.send_message(error, ephemeral=True)
-            return
-
-        self.bot.config.set(
-            ConfigKeys.SECTION_SETTINGS, ConfigKeys.KEY_EVENT_WEEKDAY, day
-        )
-        self.bot.config.set(
-            ConfigKeys.SECTION_SETTINGS, ConfigKeys.KEY_EVENT_TIME, time
-        )
-
-        await interaction.response.send_message(
-            f"開催日時を {day} {time} に設定しました。", ephemeral=True
+        await self._set_day_time(
+            interaction,
+            (ConfigKeys.KEY_EVENT_WEEKDAY, ConfigKeys.KEY_EVENT_TIME),
+            day,
+            time,
+            "開催日時",
         )
 
     @config_announce.autocomplete("day")
@@ -136,11 +205,8 @@ class ConfigCog(commands.Cog):
         Returns:
             一致する曜日の選択肢リスト
         """
-        return [
-            app_commands.Choice(name=day, value=day)
-            for day in Weekday.ALL
-            if current.lower() in day.lower()
-        ]
+        current = current.lower()
+        return [choice for day, choice in _DAY_CHOICES if current in day]
 
     @config_group.command(name="role")
     @app_commands.describe(role="確認報告でメンションするロール (告知管理者)")
@@ -164,7 +230,7 @@ class ConfigCog(commands.Cog):
 
         if not is_admin(interaction, self.bot.config):
             await interaction.response.send_message(
-                "設定を変更する権限がありません。", ephemeral=True
+                _NO_PERMISSION_MESSAGE, ephemeral=True
             )
             return
 
@@ -192,25 +258,8 @@ class ConfigCog(commands.Cog):
             interaction: コマンドインタラクション
             channel: 設定するチャンネル、またはNoneで現在の値を取得
         """
-        if channel is None:
-            await interaction.response.send_message(
-                f"現在の告知チャンネル: {self._announce_channel_name()}", ephemeral=True
-            )
-            return
-
-        if not is_admin(interaction, self.bot.config):
-            await interaction.response.send_message(
-                "設定を変更する権限がありません。", ephemeral=True
-            )
-            return
-
-        self.bot.config.set(
-            ConfigKeys.SECTION_CHANNELS,
-            ConfigKeys.KEY_ANNOUNCE_CHANNEL_ID,
-            str(channel.id),
-        )
-        await interaction.response.send_message(
-            f"告知チャンネルを {channel.name} に設定しました。", ephemeral=True
+        await self._get_or_set_channel(
+            interaction, ConfigKeys.KEY_ANNOUNCE_CHANNEL_ID, channel, "告知チャンネル"
         )
 
     @config_channel.command(name="confirm")
@@ -226,25 +275,8 @@ class ConfigCog(commands.Cog):
             interaction: コマンドインタラクション
             channel: 設定するチャンネル、またはNoneで現在の値を取得
         """
-        if channel is None:
-            await interaction.response.send_message(
-                f"現在の確認チャンネル: {self._confirm_channel_name()}", ephemeral=True
-            )
-            return
-
-        if not is_admin(interaction, self.bot.config):
-            await interaction.response.send_message(
-                "設定を変更する権限がありません。", ephemeral=True
-            )
-            return
-
-        self.bot.config.set(
-            ConfigKeys.SECTION_CHANNELS,
-            ConfigKeys.KEY_CONFIRM_CHANNEL_ID,
-            str(channel.id),
-        )
-        await interaction.response.send_message(
-            f"確認チャンネルを {channel.name} に設定しました。", ephemeral=True
+        await self._get_or_set_channel(
+            interaction, ConfigKeys.KEY_CONFIRM_CHANNEL_ID, channel, "確認チャンネル"
         )
 
     def _channel_name(self, key: str) -> str:
@@ -256,29 +288,25 @@ class ConfigCog(commands.Cog):
         Returns:
             チャンネル名。未設定なら「未設定」
         """
-        channel_id = self.bot.config.get(ConfigKeys.SECTION_CHANNELS, key, "")
-        if not channel_id:
-            return "未設定"
-        channel = self.bot.get_channel(int(channel_id))
-        if isinstance(channel, discord.TextChannel):
-            return channel.name
-        return f"未知 (ID: {channel_id})"
-
-    def _announce_channel_name(self) -> str:
-        """設定された公開告知チャンネルの表示名を返す。
+        return self._format_channel(
+            self.bot.config.get(ConfigKeys.SECTION_CHANNELS, key, "")
+        )
 
-        Returns:
-            チャンネル名。未設定なら「未設定」
-        """
-        return self._channel_name(ConfigKeys.KEY_ANNOUNCE_CHANNEL_ID)
+    def _format_channel(self, channel_id: str) -> str:
+        """チャンネルIDを表示名に変換する。
 
-    def _confirm_channel_name(self) -> str:
-        """設定された確認チャンネルの表示名を返す。
+        Args:
+            channel_id: チャンネルID（空文字なら未設定）
 
         Returns:
             チャンネル名。未設定なら「未設定」
         """
-        return self._channel_name(ConfigKeys.KEY_CONFIRM_CHANNEL_ID)
+        if not channel_id:
+            return "未設定"
+        channel = self.bot.get_channel(int(channel_id))
+        if isinstance(channel, discord.TextChannel):
+            return channel.name
+        return f"未知 (ID: {channel_id})"
 
     @config_group.command(name="show")
     async def config_show(self, interaction: discord.Interaction):
@@ -287,18 +315,27 @@ class ConfigCog(commands.Cog):
         Args:
             interaction: コマンドインタラクション
         """
-        get = self.bot.config.get
-        s = ConfigKeys.SECTION_SETTINGS
+        snapshot = self.bot.config.snapshot(
+            ConfigKeys.SECTION_SETTINGS, ConfigKeys.SECTION_CHANNELS
+        )
+        settings = snapshot[ConfigKeys.SECTION_SETTINGS]
+        channels = snapshot[ConfigKeys.SECTION_CHANNELS]
+        announce_channel = self._format_channel(
+            channels.get(ConfigKeys.KEY_ANNOUNCE_CHANNEL_ID, "")
+        )
+        confirm_channel = self._format_channel(
+            channels.get(ConfigKeys.KEY_CONFIRM_CHANNEL_ID, "")
+        )
         config_info = [
             "**現在の設定:**",
-            f"初回告知: {get(s, ConfigKeys.KEY_ANNOUNCE_WEEKDAY, 'Sun')} "
-            f"{get(s, ConfigKeys.KEY_ANNOUNCE_TIME, '12:00')}",
-            f"開催日時: {get(s, ConfigKeys.KEY_EVENT_WEEKDAY, 'Wed')} "
-            f"{get(s, ConfigKeys.KEY_EVENT_TIME, '21:30')}",
-            f"アクションロール: {get(s, ConfigKeys.KEY_ACTION_ROLE, '@everyone')}",
-            f"告知チャンネル: {self._announce_channel_name()}",
-            f"確認チャンネル: {self._confirm_channel_name()}",
-            f"デフォルトURL: {get(s, ConfigKeys.KEY_DEFAULT_URL, '')}",
+            f"初回告知: {settings.get(ConfigKeys.KEY_ANNOUNCE_WEEKDAY, 'Sun')} "
+            f"{settings.get(ConfigKeys.KEY_ANNOUNCE_TIME, '12:00')}",
+            f"開催日時: {settings.get(ConfigKeys.KEY_EVENT_WEEKDAY, 'Wed')} "
+            f"{settings.get(ConfigKeys.KEY_EVENT_TIME, '21:30')}",
+            f"アクションロール: {settings.get(ConfigKeys.KEY_ACTION_ROLE, '@everyone')}",
+            f"告知チャンネル: {announce_channel}",
+            f"確認チャンネル: {confirm_channel}",
+            f"デフォルトURL: {settings.get(ConfigKeys.KEY_DEFAULT_URL, '')}",
         ]
         await interaction.response.send_message("\n".join(config_info), ephemeral=True)
 
@@ -311,7 +348,7 @@ class ConfigCog(commands.Cog):
         """
         if not is_admin(interaction, self.bot.config):
             await interaction.response.send_message(
-                "設定をリセットする権限がありません。", ephemeral=True
+                _NO_PERMISSION_RESET_MESSAGE, ephemeral=True
             )
             return
 
@@ -320,7 +357,7 @@ class ConfigCog(commands.Cog):
         await interaction.response.send_message(
             "全ての設定をデフォルト値にリセットしました。", ephemeral=True
         )
-        self.logger.info(f"全設定が {interaction.user} によってリセットされました")
+        self.logger.info("全設定が %s によってリセットされました", interaction.user)
 
     @config_announce.error
     @config_event.error
@@ -338,7 +375,7 @@ class ConfigCog(commands.Cog):
             interaction: コマンドインタラクション
             error: 発生したエラー
         """
-        self.logger.error(f"設定コマンドでエラーが発生しました: {error}")
+        self.logger.error("設定コマンドでエラーが発生しました: %s", error)
         if not interaction.response.is_done():
             await interaction.response.send_message(
                 f"エラーが発生しました: {error}", ephemeral=True
@@ -2,6 +2,8 @@
 """LT情報管理のためのコマンドモジュール。"""
 
 import logging
+from collections.abc import Callable
+from urllib.parse import urlsplit
 
 import discord
 from discord import app_commands
@@ -12,6 +14,33 @@ from ..constants import ConfigKeys
 from ..state import LTInfo
 from .permissions import is_lt_admin
 
+_INVALID_URL_MESSAGE = (
+    "無効なURLです。http:// または https:// で始まるURLを入力してください。"
+)
+_NO_PERMISSION_MESSAGE = "LT情報を設定する権限がありません。"
+
+
+def _is_valid_url(url: str) -> bool:
+    """空白を含まず、http(s) のスキームと有効なホストを持つ URL か判定する。
+
+    `urlsplit` は改行・タブや先頭の空白を黙って取り除くため、空白は元の文字列で確認する。
+
+    Args:
+        url: 判定する文字列
+
+    Returns:
+        有効な URL なら True
+    """
+    if any(c.isspace() for c in url):
+        return False
+    try:
+        parts = urlsplit(url)
+        parts.port  # 不正なポートはここで ValueError になる
+    except ValueError:
+        return False
+    hostname = parts.hostname or ""
+    return parts.scheme in ("http", "https") and bool(hostname.strip("."))
+
 
 class LtCog(commands.Cog):
     """LT情報を管理するためのコマンドコグ。
@@ -33,41 +62,67 @@ class LtCog(commands.Cog):
         """現在のLT情報を返す（状態ストア経由）。"""
         return self.bot.state.state.lt
 
-    def _save(self) -> None:
+    async def _save(self) -> None:
         """状態を永続化する。"""
-        self.bot.state.save()
+        await self.bot.state.save_async()
 
-    lt_group = app_commands.Group(name="lt", description="LT情報の管理")
-
-    @lt_group.command(name="speaker")
-    @app_commands.describe(name="発表者の名前")
-    async def lt_speaker(
-        self, interaction: discord.Interaction, name: str | None = None
-    ):
-        """LT発表者名を設定または取得する。
+    async def _get_or_set_field(
+        self,
+        interaction: discord.Interaction,
+        attr: str,
+        label: str,
+        value: str | None,
+        validator: tuple[Callable[[str], bool], str] | None = None,
+    ) -> None:
+        """LT情報の 1 項目を取得 (value が None) または設定する。
 
         Args:
             interaction: コマンドインタラクション
-            name: 設定する発表者名、またはNoneで現在の値を取得
+            attr: `LTInfo` の属性名
+            label: 応答に使う項目の表示名
+            value: 設定する値、またはNoneで現在の値を取得
+            validator: 設定値の検証関数と、検証に失敗したときの応答の組。
+                検証は権限確認の後に行う
         """
-        if name is None:
+        if value is None:
             await interaction.response.send_message(
-                f"現在の発表者: {self._lt.speaker_name or '未設定'}", ephemeral=True
+                f"現在の{label}: {getattr(self._lt, attr) or '未設定'}", ephemeral=True
             )
             return
 
         if not is_lt_admin(interaction, self.bot.config):
             await interaction.response.send_message(
-                "LT情報を設定する権限がありません。", ephemeral=True
+                _NO_PERMISSION_MESSAGE, ephemeral=True
             )
             return
 
-        self._lt.speaker_name = name
-        self._save()
+        if validator is not None:
+            validate, invalid_message = validator
+            if not validate(value):
+                await interaction.response.send_message(invalid_message, ephemeral=True)
+                return
+
+        setattr(self._lt, attr, value)
+        await self._save()
         await interaction.response.send_message(
-            f"発表者を '{name}' に設定しました。", ephemeral=True
+            f"{label}を '{value}' に設定しました。", ephemeral=True
         )
 
+    lt_group = app_commands.Group(name="lt", description="LT情報の管理")
+
+    @lt_group.command(name="speaker")
+    @app_commands.describe(name="発表者の名前")
+    async def lt_speaker(
+        self, interaction: discord.Interaction, name: str | None = None
+    ):
+        """LT発表者名を設定または取得する。
+
+        Args:
+            interaction: コマンドインタラクション
+            name: 設定する発表者名、またはNoneで現在の値を取得
+        """
+        await self._get_or_set_field(interaction, "speaker_name", "発表者", name)
+
     @lt_group.command(name="title")
     @app_commands.describe(title="発表のタイトル")
     async def lt_title(
@@ -79,23 +134,7 @@ class LtCog(commands.Cog):
             interaction: コマンドインタラクション
             title: 設定するタイトル、またはNoneで現在の値を取得
         """
-        if title is None:
-            await interaction.response.send_message(
-                f"現在のタイトル: {self._lt.title or '未設定'}", ephemeral=True
-            )
-            return
-
-        if not is_lt_admin(interaction, self.bot.config):
-            await interaction.response.send_message(
-                "LT情報を設定する権限がありません。", ephemeral=True
-            )
-            return
-
-        self._lt.title = title
-        self._save()
-        await interaction.response.send_message(
-            f"タイトルを '{title}' に設定しました。", ephemeral=True
-        )
+        await self._get_or_set_field(interaction, "title", "タイトル", title)
 
     @lt_group.command(name="url")
     @app_commands.describe(url="発表またはイベントのURL")
@@ -106,22 +145,8 @@ class LtCog(commands.Cog):
             interaction: コマンドインタラクション
             url: 設定するURL、またはNoneで現在の値を取得
         """
-        if url is None:
-            await interaction.response.send_message(
-                f"現在のURL: {self._lt.url or '未設定'}", ephemeral=True
-            )
-            return
-
-        if not is_lt_admin(interaction, self.bot.config):
-            await interaction.response.send_message(
-                "LT情報を設定する権限がありません。", ephemeral=True
-            )
-            return
-
-        self._lt.url = url
-        self._save()
-        await interaction.response.send_message(
-            f"URLを '{url}' に設定しました。", ephemeral=True
+        await self._get_or_set_field(
+            interaction, "url", "URL", url, (_is_valid_url, _INVALID_URL_MESSAGE)
         )
 
     @lt_group.command(name="set")
@@ -147,7 +172,13 @@ class LtCog(commands.Cog):
         """
         if not is_lt_admin(interaction, self.bot.config):
             await interaction.response.send_message(
-                "LT情報を設定する権限がありません。", ephemeral=True
+                _NO_PERMISSION_MESSAGE, ephemeral=True
+            )
+            return
+
+        if url is not None and not _is_valid_url(url):
+            await interaction.response.send_message(
+                _INVALID_URL_MESSAGE, ephemeral=True
             )
             return
 
@@ -169,7 +200,7 @@ class LtCog(commands.Cog):
             self._lt.url = default_url
             response_parts.append(f"URL: {default_url} (デフォルト)")
 
-        self._save()
+        await self._save()
         await interaction.response.send_message(
             "\n".join(response_parts), ephemeral=True
         )
@@ -182,7 +213,7 @@ class LtCog(commands.Cog):
             interaction: コマンドインタラクション
         """
         lt = self._lt
-        if not any([lt.speaker_name, lt.title, lt.url]):
+        if not any((lt.speaker_name, lt.title, lt.url)):
             await interaction.response.send_message(
                 "LT情報は設定されていません。", ephemeral=True
             )
@@ -207,11 +238,11 @@ class LtCog(commands.Cog):
             return
 
         self._lt.clear()
-        self._save()
+        await self._save()
         await interaction.response.send_message(
             "LT情報をクリアしました。", ephemeral=True
         )
-        self.logger.info(f"LT情報が {interaction.user} によってクリアされました")
+        self.logger.info("LT情報が %s によってクリアされました", interaction.user)
 
     @lt_speaker.error
     @lt_title.error
@@ -228,7 +259,7 @@ class LtCog(commands.Cog):
             interaction: コマンドインタラクション
             error: 発生したエラー
         """
-        self.logger.error(f"LTコマンドでエラーが発生しました: {error}")
+        self.logger.error("LTコマンドでエラーが発生しました: %s", error)
         if not interaction.response.is_done():
             await interaction.response.send_message(
                 f"エラーが発生しました: {error}", ephemeral=True
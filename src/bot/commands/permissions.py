@@ -6,6 +6,9 @@ import discord
 from ..config import ConfigManager
 from ..constants import ConfigKeys
 
+# admin / moderator 向けコマンドの権限エラー応答
+NO_PERMISSION_MESSAGE = "このコマンドを実行する権限がありません。"
+
 
 def _has_any_role(
     interaction: discord.Interaction, config: ConfigManager, *role_keys: str
@@ -23,10 +26,8 @@ def _has_any_role(
     if not isinstance(interaction.user, discord.Member):
         return False
 
-    allowed: set[str] = set()
-    for key in role_keys:
-        allowed.update(config.get(ConfigKeys.SECTION_PERMISSIONS, key, []))
-    return any(role.name in allowed for role in interaction.user.roles)
+    allowed = config.role_names(*role_keys)
+    return not allowed.isdisjoint(role.name for role in interaction.user.roles)
 
 
 def is_admin(interaction: discord.Interaction, config: ConfigManager) -> bool:
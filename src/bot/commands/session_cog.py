@@ -9,10 +9,11 @@ from discord.ext import commands
 
 from ..client import AnnounceBotClient
 from ..constants import TYPE_BY_SLUG, AnnouncementType
-from .permissions import is_admin
+from .choices import TYPE_CHOICES
+from .permissions import NO_PERMISSION_MESSAGE, is_admin
 
-# 種別スラッグのオートコンプリート候補
-_TYPE_CHOICES = list(TYPE_BY_SLUG.keys())
+_INVALID_TYPE_MESSAGE = f"無効な種別です。有効な値: {', '.join(TYPE_BY_SLUG)}"
+_NO_ANNOUNCE_CHANNEL_MESSAGE = "告知チャンネルが設定されていません。`/config channel announce` で設定してください。"
 
 
 class SessionCog(commands.Cog):
@@ -61,15 +62,16 @@ class SessionCog(commands.Cog):
         announcement_type = TYPE_BY_SLUG.get(type.lower())
         if announcement_type is None:
             await interaction.response.send_message(
-                f"無効な種別です。有効な値: {', '.join(_TYPE_CHOICES)}",
-                ephemeral=True,
+                _INVALID_TYPE_MESSAGE, ephemeral=True
             )
             return
 
+        # 再告知で Discord API を呼ぶため、応答期限内に defer しておく
+        await interaction.response.defer(ephemeral=True)
         self.bot.state.state.session_type = announcement_type
-        self.bot.state.save()
+        await self.bot.state.save_async()
         self.logger.info(
-            f"{interaction.user} が種別を {announcement_type} に変更しました"
+            "%s が種別を %s に変更しました", interaction.user, announcement_type
         )
 
         # 公開告知を新しい種別で再投稿 (まだ告知していない週は何もしない)
@@ -81,7 +83,7 @@ class SessionCog(commands.Cog):
             and not self.bot.state.state.lt.is_complete
         ):
             message += "\n⚠️ LT情報が不完全です。`/lt set` で設定してください。"
-        await interaction.response.send_message(message, ephemeral=True)
+        await interaction.followup.send(message, ephemeral=True)
 
     @plan_set.autocomplete("type")
     async def type_autocomplete(
@@ -96,11 +98,8 @@ class SessionCog(commands.Cog):
         Returns:
             一致する種別の選択肢リスト
         """
-        return [
-            app_commands.Choice(name=slug, value=slug)
-            for slug in _TYPE_CHOICES
-            if current.lower() in slug.lower()
-        ]
+        current = current.lower()
+        return [choice for choice in TYPE_CHOICES if current in choice.value]
 
     @app_commands.command(name="open")
     async def open_command(self, interaction: discord.Interaction) -> None:
@@ -113,7 +112,7 @@ class SessionCog(commands.Cog):
         """
         if not is_admin(interaction, self.bot.config):
             await interaction.response.send_message(
-                "このコマンドを実行する権限がありません。", ephemeral=True
+                NO_PERMISSION_MESSAGE, ephemeral=True
             )
             return
 
@@ -137,7 +136,7 @@ class SessionCog(commands.Cog):
         channel = self.bot.get_announce_channel()
         if channel is None:
             await interaction.response.send_message(
-                "告知チャンネルが設定されていません。`/config channel announce` で設定してください。",
+                _NO_ANNOUNCE_CHANNEL_MESSAGE,
                 ephemeral=True,
             )
             return
@@ -164,14 +163,14 @@ class SessionCog(commands.Cog):
         """
         if not is_admin(interaction, self.bot.config):
             await interaction.response.send_message(
-                "このコマンドを実行する権限がありません。", ephemeral=True
+                NO_PERMISSION_MESSAGE, ephemeral=True
             )
             return
 
         channel = self.bot.get_announce_channel()
         if channel is None:
             await interaction.response.send_message(
-                "告知チャンネルが設定されていません。`/config channel announce` で設定してください。",
+                _NO_ANNOUNCE_CHANNEL_MESSAGE,
                 ephemeral=True,
             )
             return
@@ -195,8 +194,10 @@ class SessionCog(commands.Cog):
             interaction: コマンドインタラクション
             error: 発生したエラー
         """
-        self.logger.error(f"セッションコマンドでエラーが発生しました: {error}")
-        if not interaction.response.is_done():
-            await interaction.response.send_message(
-                f"エラーが発生しました: {error}", ephemeral=True
-            )
+        self.logger.error("セッションコマンドでエラーが発生しました: %s", error)
+        message = f"エラーが発生しました: {error}"
+        if interaction.response.is_done():
+            # defer 済みの場合は followup で返さないと「考え中」のまま残る
+            await interaction.followup.send(message, ephemeral=True)
+        else:
+            await interaction.response.send_message(message, ephemeral=True)
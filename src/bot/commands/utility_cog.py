@@ -10,9 +10,8 @@ from discord.ext import commands
 from ..client import AnnounceBotClient
 from ..constants import TYPE_BY_SLUG, AnnouncementType, ConfigKeys, Weekday
 from ..scheduler import compute_next_run
-from .permissions import is_admin
-
-_TYPE_CHOICES = list(TYPE_BY_SLUG.keys())
+from .choices import TYPE_CHOICES
+from .permissions import NO_PERMISSION_MESSAGE, is_admin
 
 HELP_TEXT = """**Discord告知Bot - コマンドヘルプ**
 
@@ -74,10 +73,12 @@ class UtilityCog(commands.Cog):
             ConfigKeys.SECTION_SETTINGS, ConfigKeys.KEY_ANNOUNCE_TIME, "12:00"
         )
         hour, minute = map(int, announce_time.split(":"))
+        # 同じ時刻を基準に次回告知と次回開催日を求める
+        now = self.bot.clock.now()
         next_announce = compute_next_run(
-            self.bot.clock.now(), Weekday.to_int(announce_weekday), hour, minute
+            now, Weekday.to_int(announce_weekday), hour, minute
         )
-        event_date = self.bot.announcement_service.next_event_date()
+        event_date = self.bot.announcement_service.next_event_date(now.date())
         state = self.bot.state.state
 
         status_parts = [
@@ -118,7 +119,7 @@ class UtilityCog(commands.Cog):
         """
         if not is_admin(interaction, self.bot.config):
             await interaction.response.send_message(
-                "このコマンドを実行する権限がありません。", ephemeral=True
+                NO_PERMISSION_MESSAGE, ephemeral=True
             )
             return
 
@@ -142,7 +143,7 @@ class UtilityCog(commands.Cog):
         """
         if not is_admin(interaction, self.bot.config):
             await interaction.response.send_message(
-                "このコマンドを実行する権限がありません。", ephemeral=True
+                NO_PERMISSION_MESSAGE, ephemeral=True
             )
             return
 
@@ -185,11 +186,8 @@ class UtilityCog(commands.Cog):
         Returns:
             一致する種別の選択肢リスト
         """
-        return [
-            app_commands.Choice(name=slug, value=slug)
-            for slug in _TYPE_CHOICES
-            if current.lower() in slug.lower()
-        ]
+        current = current.lower()
+        return [choice for choice in TYPE_CHOICES if current in choice.value]
 
     @status.error
     @help_command.error
@@ -204,7 +202,7 @@ class UtilityCog(commands.Cog):
             interaction: コマンドインタラクション
             error: 発生したエラー
         """
-        self.logger.error(f"ユーティリティコマンドでエラーが発生しました: {error}")
+        self.logger.error("ユーティリティコマンドでエラーが発生しました: %s", error)
         if not interaction.response.is_done():
             await interaction.response.send_message(
                 f"エラーが発生しました: {error}", ephemeral=True
@@ -1,6 +1,7 @@
 # src/bot/config/config_manager.py
 """Botの設定管理を担当するモジュール。"""
 
+import contextlib
 import logging
 import os
 import tomllib
@@ -8,7 +9,11 @@ from typing import Any, override
 
 import tomli_w
 
-from ..constants import EnvKeys
+from ..constants import ConfigKeys, EnvKeys
+
+# `get` の探索で使う番兵 (空セクションと未設定を表す)
+_EMPTY_SECTION: dict[str, Any] = {}
+_MISSING = object()
 
 
 class ConfigManager:
@@ -38,6 +43,11 @@ class ConfigManager:
 
         self.config: dict[str, Any] = {}
         self.overrides: dict[str, Any] = {}
+        # 設定変更のたびに増える世代番号 (読み出し側キャッシュの無効化に使う)
+        self._version = 0
+        # `role_names` の結果と、それを作ったときの世代番号
+        self._role_names_cache: dict[tuple[str, ...], frozenset[str]] = {}
+        self._role_names_version = self._version
 
         # 設定を読み込む
         self._load_config()
@@ -48,19 +58,28 @@ class ConfigManager:
             # デフォルト設定を読み込む
             with open(self.config_path, "rb") as f:
                 self.config = tomllib.load(f)
-            self.logger.info(f"デフォルト設定を読み込みました: {self.config_path}")
+            self.logger.info("デフォルト設定を読み込みました: %s", self.config_path)
 
             # オーバーライド設定が存在する場合は読み込む
             if os.path.exists(self.overrides_path):
                 with open(self.overrides_path, "rb") as f:
                     self.overrides = tomllib.load(f)
                 self.logger.info(
-                    f"オーバーライド設定を読み込みました: {self.overrides_path}"
+                    "オーバーライド設定を読み込みました: %s", self.overrides_path
                 )
         except (FileNotFoundError, tomllib.TOMLDecodeError) as e:
-            self.logger.error(f"設定ファイルの読み込みに失敗しました: {e}")
+            self.logger.error("設定ファイルの読み込みに失敗しました: %s", e)
             raise
 
+    @property
+    def version(self) -> int:
+        """設定の世代番号を返す。
+
+        Returns:
+            `set` / `reset` のたびに 1 ずつ増える整数
+        """
+        return self._version
+
     def get(self, section: str, key: str, default: Any = None) -> Any:
         """設定値を取得する。オーバーライド設定を優先する。
 
@@ -73,15 +92,55 @@ class ConfigManager:
             設定値
         """
         # オーバーライド設定を優先
-        if section in self.overrides and key in self.overrides[section]:
-            return self.overrides[section][key]
+        value = self.overrides.get(section, _EMPTY_SECTION).get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        # デフォルト設定を次に確認し、見つからない場合はデフォルト値を返す
+        return self.config.get(section, _EMPTY_SECTION).get(key, default)
+
+    def role_names(self, *role_keys: str) -> frozenset[str]:
+        """`[permissions]` の指定キーの許可ロール名をまとめた集合を返す。
+
+        権限判定のたびに集合を作り直さないよう、世代番号が変わるまで結果を保持する。
+
+        Args:
+            role_keys: `[permissions]` セクションのロールキー（可変長）
+
+        Returns:
+            許可ロール名の集合
+        """
+        if self._role_names_version != self._version:
+            self._role_names_cache.clear()
+            self._role_names_version = self._version
+        if role_keys not in self._role_names_cache:
+            self._role_names_cache[role_keys] = frozenset(
+                name
+                for key in role_keys
+                for name in self.get(ConfigKeys.SECTION_PERMISSIONS, key, [])
+            )
+        return self._role_names_cache[role_keys]
 
-        # デフォルト設定を次に確認
-        if section in self.config and key in self.config[section]:
-            return self.config[section][key]
+    def snapshot(self, *sections: str) -> dict[str, dict[str, Any]]:
+        """オーバーライド適用済みの設定をセクション単位でまとめて取得する。
 
-        # 見つからない場合はデフォルト値を返す
-        return default
+        複数キーを読む場合に `get` を繰り返す代わりに使う。新しく作るのはセクションの
+        辞書のみで、リストなどの値は設定と共有しているため変更しないこと。
+
+        Args:
+            sections: 取得するセクション名（未指定なら全セクション）
+
+        Returns:
+            セクション名から「キー → 設定値」の辞書への辞書
+        """
+        names = sections or (
+            *self.config,
+            *(s for s in self.overrides if s not in self.config),
+        )
+        return {
+            name: {**self.config.get(name, {}), **self.overrides.get(name, {})}
+            for name in names
+        }
 
     def set(self, section: str, key: str, value: Any) -> None:
         """設定値を設定する。オーバーライド設定に書き込む。
@@ -91,29 +150,42 @@ class ConfigManager:
             key: 設定キー
             value: 設定値
         """
+        self.set_many(section, {key: value})
+
+    def set_many(self, section: str, values: dict[str, Any]) -> None:
+        """同じセクションの複数の設定値をまとめて設定する。
+
+        オーバーライドファイルへの保存は最後に 1 回だけ行う。
+
+        Args:
+            section: 設定セクション
+            values: 設定キーから設定値への辞書
+        """
         # セクションが存在しない場合は作成
-        if section not in self.overrides:
-            self.overrides[section] = {}
-
-        # デフォルト値を確認
-        default_value = None
-        if section in self.config and key in self.config[section]:
-            default_value = self.config[section][key]
-
-        if value == default_value:
-            # デフォルト値と同じ場合はオーバーライドを削除
-            if key in self.overrides[section]:
-                del self.overrides[section][key]
-                # 空のセクションを削除
-                if not self.overrides[section]:
-                    del self.overrides[section]
-        else:
-            # オーバーライド値を設定
-            self.overrides[section][key] = value
+        overrides = self.overrides.setdefault(section, {})
+        defaults = self.config.get(section, {})
+
+        removed = False
+        for key, value in values.items():
+            if value == defaults.get(key):
+                # デフォルト値と同じ場合はオーバーライドを削除
+                if key in overrides:
+                    del overrides[key]
+                    removed = True
+            else:
+                # オーバーライド値を設定
+                overrides[key] = value
+
+        # 空のセクションを削除
+        if removed and not overrides:
+            del self.overrides[section]
+
+        self._version += 1
 
         # オーバーライドを保存
         self._save_overrides()
-        self.logger.info(f"設定を更新しました: {section}.{key} = {value}")
+        for key, value in values.items():
+            self.logger.info("設定を更新しました: %s.%s = %s", section, key, value)
 
     def _save_overrides(self) -> None:
         """オーバーライド設定をファイルに保存する。"""
@@ -123,30 +195,42 @@ class ConfigManager:
             if parent_dir:
                 os.makedirs(parent_dir, exist_ok=True)
 
-            # オーバーライドをファイルに書き込む
-            with open(self.overrides_path, "wb") as f:
-                tomli_w.dump(self.overrides, f)
+            # 書き込み途中で中断されても既存ファイルが壊れないよう、
+            # 一時ファイルに書いてから置き換える
+            tmp_path = f"{self.overrides_path}.tmp"
+            try:
+                with open(tmp_path, "wb") as f:
+                    tomli_w.dump(self.overrides, f)
+                    # 置き換えより先に内容がディスクへ書かれるようにする
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.overrides_path)
+            except Exception:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_path)
+                raise
             self.logger.debug(
-                f"オーバーライド設定を保存しました: {self.overrides_path}"
+                "オーバーライド設定を保存しました: %s", self.overrides_path
             )
         except Exception as e:
-            self.logger.error(f"オーバーライド設定の保存に失敗しました: {e}")
+            self.logger.error("オーバーライド設定の保存に失敗しました: %s", e)
             raise
 
     def reset(self) -> None:
         """全ての設定をデフォルト値にリセットする。"""
         self.overrides = {}
+        self._version += 1
 
         # オーバーライドファイルが存在する場合は削除
         if os.path.exists(self.overrides_path):
             try:
                 os.remove(self.overrides_path)
                 self.logger.info(
-                    f"オーバーライド設定ファイルを削除しました: {self.overrides_path}"
+                    "オーバーライド設定ファイルを削除しました: %s", self.overrides_path
                 )
             except OSError as e:
                 self.logger.error(
-                    f"オーバーライド設定ファイルの削除に失敗しました: {e}"
+                    "オーバーライド設定ファイルの削除に失敗しました: %s", e
                 )
                 raise
 
@@ -155,17 +239,4 @@ class ConfigManager:
     @override
     def __str__(self) -> str:
         """現在の設定（オーバーライド適用済み）の文字列表現を返す。"""
-        result: dict[str, Any] = {}
-        for section in self.config:
-            result[section] = {}
-            for key, value in self.config[section].items():
-                result[section][key] = value
-
-        # オーバーライドを適用
-        for section in self.overrides:
-            if section not in result:
-                result[section] = {}
-            for key, value in self.overrides[section].items():
-                result[section][key] = value
-
-        return str(result)
+        return str(self.snapshot())
@@ -70,6 +70,7 @@ class EnvKeys:
     CONFIG_PATH = "CONFIG_PATH"
     CONFIG_OVERRIDES_PATH = "CONFIG_OVERRIDES_PATH"
     STATE_PATH = "STATE_PATH"
+    FORCE_COMMAND_SYNC = "FORCE_COMMAND_SYNC"
 
 
 # アナウンスメントタイプ
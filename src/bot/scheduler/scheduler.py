@@ -74,13 +74,13 @@ class TaskScheduler:
         existing = self.tasks.get(task_id)
         if existing is not None and not existing.done():
             existing.cancel()
-            self.logger.info(f"既存のタスクをキャンセルしました: {task_id}")
+            self.logger.info("既存のタスクをキャンセルしました: %s", task_id)
 
         self.tasks[task_id] = asyncio.create_task(
             self._run_weekly(weekday, time_str, callback)
         )
         self.logger.info(
-            f"タスク {task_id} をスケジュールしました: {weekday}曜日 {time_str}"
+            "タスク %s をスケジュールしました: %s曜日 %s", task_id, weekday, time_str
         )
 
     async def _run_weekly(
@@ -103,17 +103,17 @@ class TaskScheduler:
             now = self.clock.now()
             target = compute_next_run(now, target_weekday, hour, minute)
             seconds_to_wait = (target - now).total_seconds()
-            self.logger.debug(f"{seconds_to_wait:.1f}秒待機します（目標: {target}）")
+            self.logger.debug("%.1f秒待機します（目標: %s）", seconds_to_wait, target)
 
             try:
                 await asyncio.sleep(seconds_to_wait)
-                self.logger.info(f"スケジュールタスクを実行します: {self.clock.now()}")
+                self.logger.info("スケジュールタスクを実行します: %s", self.clock.now())
                 await callback()
             except asyncio.CancelledError:
                 self.logger.info("タスクがキャンセルされました")
                 break
             except Exception as e:
-                self.logger.error(f"スケジュールタスクでエラーが発生しました: {e}")
+                self.logger.error("スケジュールタスクでエラーが発生しました: %s", e)
                 # 連続エラーを避けるため少し待機
                 await asyncio.sleep(60)
 
@@ -122,5 +122,5 @@ class TaskScheduler:
         for task_id, task in self.tasks.items():
             if not task.done():
                 task.cancel()
-                self.logger.info(f"タスクをキャンセルしました: {task_id}")
+                self.logger.info("タスクをキャンセルしました: %s", task_id)
         self.tasks.clear()
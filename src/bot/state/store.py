@@ -4,6 +4,7 @@
 状態は JSON ファイルに保存し、Docker コンテナの再起動・再ビルドをまたいで 保持できるようにする。
 """
 
+import asyncio
 import datetime
 import json
 import logging
@@ -13,8 +14,11 @@ from typing import Any, override
 
 from ..constants import AnnouncementType
 
+# LT情報の項目 (属性名と表示名) の表示順
+_LT_FIELD_LABELS = (("speaker_name", "発表者"), ("title", "タイトル"), ("url", "URL"))
 
-@dataclass
+
+@dataclass(slots=True)
 class LTInfo:
     """LT（ライトニングトーク）の情報を格納するデータクラス。"""
 
@@ -29,11 +33,7 @@ class LTInfo:
         Returns:
             すべて設定済みなら True
         """
-        return (
-            self.speaker_name is not None
-            and self.title is not None
-            and self.url is not None
-        )
+        return None not in (self.speaker_name, self.title, self.url)
 
     def clear(self) -> None:
         """全てのLT情報をクリアする。"""
@@ -44,20 +44,15 @@ class LTInfo:
     @override
     def __str__(self) -> str:
         """LT情報の文字列表現を返す。"""
-        if not any([self.speaker_name, self.title, self.url]):
+        fields = [(label, getattr(self, attr)) for attr, label in _LT_FIELD_LABELS]
+        if not any(value for _, value in fields):
             return "LT情報は設定されていません"
-
-        parts: list[str] = []
-        if self.speaker_name is not None:
-            parts.append(f"発表者: {self.speaker_name}")
-        if self.title is not None:
-            parts.append(f"タイトル: {self.title}")
-        if self.url is not None:
-            parts.append(f"URL: {self.url}")
-        return "\n".join(parts)
+        return "\n".join(
+            f"{label}: {value}" for label, value in fields if value is not None
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionState:
     """今週のML集会に関する永続化対象の状態。"""
 
@@ -66,6 +61,8 @@ class SessionState:
     announce_message_id: int | None = None
     confirm_message_id: int | None = None
     target_event_date: datetime.date | None = None
+    # 最後にスラッシュコマンドを sync したときのコマンド定義のハッシュ
+    command_tree_hash: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """JSON 直列化可能な辞書へ変換する。
@@ -87,6 +84,7 @@ class SessionState:
                 if self.target_event_date is not None
                 else None
             ),
+            "command_tree_hash": self.command_tree_hash,
         }
 
     @classmethod
@@ -119,6 +117,7 @@ class SessionState:
             announce_message_id=data.get("announce_message_id"),
             confirm_message_id=data.get("confirm_message_id"),
             target_event_date=target_event_date,
+            command_tree_hash=data.get("command_tree_hash"),
         )
 
 
@@ -133,6 +132,7 @@ class StateStore:
         """
         self.logger = logging.getLogger("announce-bot.state")
         self._path = path
+        self._write_lock = asyncio.Lock()
         self._state = self._load()
 
     @property
@@ -147,26 +147,44 @@ class StateStore:
     def _load(self) -> SessionState:
         """状態ファイルを読み込む。存在しない・壊れている場合は既定値を返す。"""
         if not os.path.exists(self._path):
-            self.logger.info(f"状態ファイルが無いため既定値で開始します: {self._path}")
+            self.logger.info("状態ファイルが無いため既定値で開始します: %s", self._path)
             return SessionState()
         try:
             with open(self._path, encoding="utf-8") as f:
                 data = json.load(f)
-            self.logger.info(f"状態を読み込みました: {self._path}")
+            self.logger.info("状態を読み込みました: %s", self._path)
             return SessionState.from_dict(data)
         except (OSError, ValueError) as e:
-            self.logger.error(f"状態の読み込みに失敗しました (既定値で続行): {e}")
+            self.logger.error("状態の読み込みに失敗しました (既定値で続行): %s", e)
             return SessionState()
 
     def save(self) -> None:
         """現在の状態をファイルへ保存する。"""
+        self._write(self._state.to_dict())
+
+    async def save_async(self) -> None:
+        """現在の状態をイベントループを塞がずにファイルへ保存する。
+
+        直列化はループ上で行い、書き込みのみをスレッドへ逃がす。
+        同時に呼ばれた場合は書き込み順が入れ替わらないよう 1 件ずつ処理する。
+        """
+        data = self._state.to_dict()
+        async with self._write_lock:
+            await asyncio.to_thread(self._write, data)
+
+    def _write(self, data: dict[str, Any]) -> None:
+        """直列化済みの状態をファイルへ書き込む。
+
+        Args:
+            data: `SessionState.to_dict` 形式の辞書
+        """
         try:
             parent_dir = os.path.dirname(self._path)
             if parent_dir:
                 os.makedirs(parent_dir, exist_ok=True)
             with open(self._path, "w", encoding="utf-8") as f:
-                json.dump(self._state.to_dict(), f, ensure_ascii=False, indent=2)
-            self.logger.debug(f"状態を保存しました: {self._path}")
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            self.logger.debug("状態を保存しました: %s", self._path)
         except OSError as e:
-            self.logger.error(f"状態の保存に失敗しました: {e}")
+            self.logger.error("状態の保存に失敗しました: %s", e)
             raise
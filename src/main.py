@@ -34,7 +34,7 @@ async def shutdown(signal: signal.Signals | None = None):
     logger = logging.getLogger("announce-bot")
 
     if signal:
-        logger.info(f"シグナル {signal.name} を受信しました。シャットダウンします...")
+        logger.info("シグナル %s を受信しました。シャットダウンします...", signal.name)
     else:
         logger.info("シャットダウンします...")
 
@@ -83,7 +83,7 @@ async def main():
         bot = AnnounceBotClient()
         await bot.start(token)
     except Exception as e:
-        logger.error(f"エラーが発生しました: {e}")
+        logger.error("エラーが発生しました: %s", e)
         await shutdown()
     finally:
         if not shutdown_flag:
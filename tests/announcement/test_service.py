@@ -7,8 +7,10 @@ from unittest.mock import AsyncMock, MagicMock
 import discord
 import pytest
 
-from bot.constants import AnnouncementType
+from bot.announcement.service import AnnouncementService
+from bot.constants import AnnouncementType, ConfigKeys
 from bot.state import LTInfo
+from tests.conftest import FixedClock
 
 
 def test_next_event_date_is_upcoming_wednesday(service):
@@ -18,6 +20,48 @@ def test_next_event_date_is_upcoming_wednesday(service):
     assert service.next_event_date() == datetime.date(2026, 6, 10)
 
 
+@pytest.mark.parametrize(
+    ("now", "expected"),
+    [
+        # 開催当日 (水) は当日を含まず翌週の水曜
+        (datetime.datetime(2026, 6, 10, 9, 0), datetime.date(2026, 6, 17)),
+        # 前日 (火) は翌日
+        (datetime.datetime(2026, 6, 9, 9, 0), datetime.date(2026, 6, 10)),
+        # 翌日 (木) は 6 日後
+        (datetime.datetime(2026, 6, 11, 9, 0), datetime.date(2026, 6, 17)),
+    ],
+)
+def test_next_event_date_excludes_today(config, state, now, expected):
+    """The next event date is always 1-7 days ahead, never today."""
+    service = AnnouncementService(config, state, FixedClock(now))
+    assert service.next_event_date() == expected
+
+
+def test_config_change_is_reflected_on_next_read(service):
+    """A config update is reflected in the next announcement and event date."""
+    assert service.next_event_date() == datetime.date(2026, 6, 10)
+
+    service.config.set(ConfigKeys.SECTION_SETTINGS, ConfigKeys.KEY_EVENT_WEEKDAY, "Fri")
+    service.config.set(ConfigKeys.SECTION_SETTINGS, ConfigKeys.KEY_DEFAULT_URL, "u")
+
+    assert service.next_event_date() == datetime.date(2026, 6, 12)
+    assert service.build_announce(AnnouncementType.REGULAR).endswith("u")
+
+
+def test_default_templates_pass_validation(config, state, clock, caplog):
+    """The shipped templates produce no validation warnings."""
+    AnnouncementService(config, state, clock)
+    assert "テンプレート" not in caplog.text
+
+
+def test_unknown_template_variable_is_warned(config, state, clock, caplog):
+    """A typo in a template placeholder is reported once at startup."""
+    config.set(ConfigKeys.SECTION_TEMPLATES, "announce_regular", "$mnth/$day")
+    AnnouncementService(config, state, clock)
+    assert "announce_regular" in caplog.text
+    assert "mnth" in caplog.text
+
+
 def test_build_announce_regular_has_date_without_legend(service):
     """Regular announce embeds the event date and does NOT append a legend.
 
@@ -96,6 +140,29 @@ async def test_send_announce_no_reactions_and_persists_message_id(service):
     assert service.state.state.target_event_date == datetime.date(2026, 6, 10)
 
 
+@pytest.mark.asyncio
+async def test_send_announce_uses_given_event_date(service):
+    """A caller-supplied event date is rendered and persisted as-is."""
+    channel = MagicMock(spec=discord.TextChannel)
+    channel.name = "announce"
+    sent = MagicMock(spec=discord.Message)
+    sent.id = 1
+    channel.send = AsyncMock(return_value=sent)
+
+    await service.send_announce(channel, datetime.date(2026, 6, 17))
+
+    assert "6/17" in channel.send.await_args.args[0]
+    assert service.state.state.target_event_date == datetime.date(2026, 6, 17)
+
+
+def test_next_event_date_accepts_explicit_today(service):
+    """An explicit base date overrides the clock."""
+    # 2026-06-11 (木) 基準なら次の水曜は 2026-06-17
+    assert service.next_event_date(datetime.date(2026, 6, 11)) == datetime.date(
+        2026, 6, 17
+    )
+
+
 @pytest.mark.asyncio
 async def test_send_confirm_adds_reactions_and_persists_confirm_id(service):
     """send_confirm posts a mentioned report, adds 4 reactions, stores the
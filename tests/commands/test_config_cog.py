@@ -56,10 +56,11 @@ async def test_announce_rejects_invalid_day(config_cog):
 
 
 @pytest.mark.asyncio
-async def test_announce_rejects_invalid_time(config_cog):
+@pytest.mark.parametrize("time", ["25:99", "12:00\n", "12:5", "１２:００"])
+async def test_announce_rejects_invalid_time(config_cog, time):
     """An invalid time format is rejected."""
     interaction = make_interaction(make_member("Moderator"))
-    await config_cog.config_announce.callback(config_cog, interaction, "Sun", "25:99")
+    await config_cog.config_announce.callback(config_cog, interaction, "Sun", time)
     assert "無効な時間" in interaction.response.send_message.await_args.args[0]
 
 
@@ -95,3 +96,44 @@ async def test_event_sets_event_schedule(config_cog):
     cfg = config_cog.bot.config
     assert cfg.get(ConfigKeys.SECTION_SETTINGS, ConfigKeys.KEY_EVENT_WEEKDAY) == "Thu"
     assert cfg.get(ConfigKeys.SECTION_SETTINGS, ConfigKeys.KEY_EVENT_TIME) == "20:00"
+
+
+@pytest.mark.asyncio
+async def test_permission_follows_updated_roles(config_cog):
+    """Role changes in the config are honoured by the permission check."""
+    denied = make_interaction(make_member("Organizer"))
+    await config_cog.config_announce.callback(config_cog, denied, "Mon", "09:30")
+    assert "権限" in denied.response.send_message.await_args.args[0]
+
+    interaction = make_interaction(make_member("Organizer"))
+    config_cog.bot.config.set(
+        ConfigKeys.SECTION_PERMISSIONS, ConfigKeys.KEY_MODERATOR_ROLES, ["Organizer"]
+    )
+    await config_cog.config_announce.callback(config_cog, interaction, "Mon", "09:30")
+    assert (
+        config_cog.bot.config.get(
+            ConfigKeys.SECTION_SETTINGS, ConfigKeys.KEY_ANNOUNCE_WEEKDAY
+        )
+        == "Mon"
+    )
+
+
+@pytest.mark.asyncio
+async def test_show_lists_effective_settings(config_cog):
+    """The show command reflects overridden settings."""
+    config_cog.bot.config.set(
+        ConfigKeys.SECTION_SETTINGS, ConfigKeys.KEY_EVENT_TIME, "20:00"
+    )
+    config_cog.bot.get_channel = MagicMock(return_value=None)
+    interaction = make_interaction(make_member("Member"))
+    await config_cog.config_show.callback(config_cog, interaction)
+    content = interaction.response.send_message.await_args.args[0]
+    assert "開催日時: Wed 20:00" in content
+
+
+@pytest.mark.asyncio
+async def test_day_autocomplete_is_case_insensitive(config_cog):
+    """Autocomplete matches weekday names regardless of case."""
+    interaction = make_interaction(make_member("Member"))
+    choices = await config_cog.day_autocomplete(interaction, "S")
+    assert [choice.value for choice in choices] == ["Sat", "Sun"]
@@ -31,6 +31,52 @@ async def test_speaker_setter_requires_permission(lt_cog):
     assert "権限" in interaction.response.send_message.await_args.args[0]
 
 
+@pytest.mark.asyncio
+async def test_title_setter_then_getter(lt_cog):
+    """A moderator sets the title and the getter reports it back."""
+    setter = make_interaction(make_member("Moderator"))
+    await lt_cog.lt_title.callback(lt_cog, setter, "強化学習入門")
+    assert lt_cog.bot.state.state.lt.title == "強化学習入門"
+
+    getter = make_interaction()
+    await lt_cog.lt_title.callback(lt_cog, getter, None)
+    assert getter.response.send_message.await_args.args[0] == (
+        "現在のタイトル: 強化学習入門"
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "url",
+    [
+        "example.com",
+        "ftp://example.com",
+        "https://",
+        "https://ex ample.com",
+        "https://exa\nmple.com",
+        "https://ex\tample.com",
+        "https://example.com\n",
+        " https://example.com",
+        "http://a:notaport/",
+        "https://.",
+    ],
+)
+async def test_url_setter_rejects_invalid_url(lt_cog, url):
+    """URLs without an http(s) scheme and a whitespace-free host are not stored."""
+    interaction = make_interaction(make_member("Moderator"))
+    await lt_cog.lt_url.callback(lt_cog, interaction, url)
+    assert lt_cog.bot.state.state.lt.url is None
+    assert "無効なURL" in interaction.response.send_message.await_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_url_setter_checks_permission_before_url(lt_cog):
+    """A user without permission gets the permission error even for a bad URL."""
+    interaction = make_interaction(make_member("Member"))
+    await lt_cog.lt_url.callback(lt_cog, interaction, "example.com")
+    assert "権限" in interaction.response.send_message.await_args.args[0]
+
+
 @pytest.mark.asyncio
 async def test_lt_set_persists_to_state(lt_cog):
     """A moderator can set LT info and it is stored in state."""
@@ -33,6 +33,10 @@ async def test_plan_set_updates_session_type_and_reannounces(session_cog):
     await session_cog.plan_set.callback(session_cog, interaction, "workspace")
     assert session_cog.bot.state.state.session_type == AnnouncementType.WORKSPACE
     session_cog.bot.reannounce.assert_awaited_once()
+    # 再告知より前に defer し、結果は followup で返す
+    interaction.response.defer.assert_awaited_once_with(ephemeral=True)
+    interaction.response.send_message.assert_not_awaited()
+    assert "作業部屋開催" in interaction.followup.send.await_args.args[0]
 
 
 @pytest.mark.asyncio
@@ -50,7 +54,7 @@ async def test_plan_set_lt_warns_when_incomplete(session_cog):
     interaction = make_interaction(make_member("Moderator"))
     await session_cog.plan_set.callback(session_cog, interaction, "lt")
     assert session_cog.bot.state.state.session_type == AnnouncementType.LIGHTNING_TALK
-    assert "不完全" in interaction.response.send_message.await_args.args[0]
+    assert "不完全" in interaction.followup.send.await_args.args[0]
 
 
 @pytest.mark.asyncio
@@ -59,6 +63,7 @@ async def test_plan_set_invalid_type(session_cog):
     interaction = make_interaction(make_member("Moderator"))
     await session_cog.plan_set.callback(session_cog, interaction, "party")
     assert "無効な種別" in interaction.response.send_message.await_args.args[0]
+    interaction.response.defer.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -114,3 +119,24 @@ async def test_open_lt_complete_posts(session_cog):
     await session_cog.open_command.callback(session_cog, interaction)
 
     channel.send.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_type_autocomplete_filters_slugs(session_cog):
+    """Autocomplete matches slugs case-insensitively."""
+    interaction = make_interaction()
+    choices = await session_cog.type_autocomplete(interaction, "RE")
+    assert [choice.value for choice in choices] == ["regular", "rest"]
+
+
+@pytest.mark.asyncio
+async def test_error_after_defer_is_reported_via_followup(session_cog):
+    """Errors raised after deferring are sent as a followup message."""
+    interaction = make_interaction(make_member("Moderator"))
+    interaction.response.is_done = MagicMock(return_value=True)
+    error = discord.app_commands.AppCommandError("boom")
+
+    await session_cog.session_command_error(interaction, error)
+
+    interaction.response.send_message.assert_not_awaited()
+    assert "boom" in interaction.followup.send.await_args.args[0]
@@ -1,6 +1,7 @@
 # tests/config/test_config_manager.py
 """Tests for the configuration manager module."""
 
+import copy
 from unittest.mock import mock_open, patch
 
 import pytest
@@ -38,9 +39,14 @@ def mock_config_files():
     with (
         patch("builtins.open", mock_open()),
         patch("os.path.exists", return_value=True),
-        patch("tomllib.load", side_effect=[SAMPLE_CONFIG, SAMPLE_OVERRIDES]),
+        patch(
+            "tomllib.load",
+            side_effect=[copy.deepcopy(SAMPLE_CONFIG), copy.deepcopy(SAMPLE_OVERRIDES)],
+        ),
         patch("tomli_w.dump") as dump_mock,
         patch("os.makedirs"),
+        patch("os.replace"),
+        patch("os.fsync"),
     ):
         yield dump_mock
 
@@ -105,10 +111,19 @@ def test_set_to_default_value(config_manager, mock_config_files):
     """Test setting a value to its default removes it from overrides."""
     # Set a value to its default in config
     config_manager.set("settings", "confirm_time", "21:30")
-    assert "confirm_time" not in config_manager.overrides["settings"]
+    assert "confirm_time" not in config_manager.overrides.get("settings", {})
     assert mock_config_files.called
 
 
+def test_set_many_saves_once(config_manager, mock_config_files):
+    """Setting several keys writes the overrides file a single time."""
+    config_manager.set_many(
+        "channels", {"announce_channel_id": "42", "action_channel_id": ""}
+    )
+    assert config_manager.overrides["channels"] == {"announce_channel_id": "42"}
+    mock_config_files.assert_called_once()
+
+
 def test_reset_all_settings(config_manager):
     """Test resetting all configuration settings."""
     with (
@@ -119,3 +134,79 @@ def test_reset_all_settings(config_manager):
         config_manager.reset()
         assert config_manager.overrides == {}
         assert remove_mock.called
+
+
+def test_version_bumps_on_set_and_reset(config_manager):
+    """Every mutation bumps the config generation number."""
+    initial = config_manager.version
+    config_manager.set("settings", "confirm_time", "22:00")
+    assert config_manager.version == initial + 1
+
+    with patch("os.path.exists", return_value=False):
+        config_manager.reset()
+    assert config_manager.version == initial + 2
+
+
+def test_snapshot_merges_overrides(config_manager):
+    """A snapshot returns effective values per section in new section dicts."""
+    snapshot = config_manager.snapshot("channels")
+    assert snapshot == {
+        "channels": {"action_channel_id": "123456789", "announce_channel_id": ""}
+    }
+
+    snapshot["channels"]["action_channel_id"] = "0"
+    assert config_manager.get("channels", "action_channel_id") == "123456789"
+
+    assert set(config_manager.snapshot()) == {"settings", "channels"}
+
+
+def test_role_names_follow_config_changes(config_manager):
+    """Role names are cached per key tuple and rebuilt after a change."""
+    assert config_manager.role_names("admin_roles") == frozenset()
+
+    config_manager.set("permissions", "admin_roles", ["Admin"])
+    config_manager.set("permissions", "moderator_roles", ["Mod", "Admin"])
+    roles = config_manager.role_names("admin_roles", "moderator_roles")
+    assert roles == {"Admin", "Mod"}
+    assert config_manager.role_names("admin_roles", "moderator_roles") is roles
+
+    config_manager.set("permissions", "admin_roles", ["Owner"])
+    assert config_manager.role_names("admin_roles") == {"Owner"}
+
+
+def test_str_shows_effective_settings(config_manager):
+    """The string form reflects overrides on top of the defaults."""
+    text = str(config_manager)
+    assert "'action_channel_id': '123456789'" in text
+    assert "'announce_weekday': 'Sun'" in text
+
+
+def test_save_overrides_replaces_file_atomically(tmp_path):
+    """Overrides are written to a temporary file and then moved into place."""
+    config_path = tmp_path / "config.toml"
+    config_path.write_text('[settings]\nevent_time = "21:30"\n', encoding="utf-8")
+    overrides_path = tmp_path / "config-overrides.toml"
+    manager = ConfigManager(str(config_path), str(overrides_path))
+
+    manager.set("settings", "event_time", "20:00")
+
+    assert 'event_time = "20:00"' in overrides_path.read_text(encoding="utf-8")
+    assert not (tmp_path / "config-overrides.toml.tmp").exists()
+
+
+def test_save_overrides_failure_keeps_file_and_removes_tmp(tmp_path):
+    """A failed write leaves the previous overrides and no temporary file."""
+    config_path = tmp_path / "config.toml"
+    config_path.write_text('[settings]\nevent_time = "21:30"\n', encoding="utf-8")
+    overrides_path = tmp_path / "config-overrides.toml"
+    manager = ConfigManager(str(config_path), str(overrides_path))
+    manager.set("settings", "event_time", "20:00")
+
+    with (
+        patch("tomli_w.dump", side_effect=OSError("disk full")),
+        pytest.raises(OSError),
+    ):
+        manager.set("settings", "event_time", "19:00")
+
+    assert 'event_time = "20:00"' in overrides_path.read_text(encoding="utf-8")
+    assert not (tmp_path / "config-overrides.toml.tmp").exists()
@@ -3,6 +3,8 @@
 
 import datetime
 
+import pytest
+
 from bot.constants import AnnouncementType
 from bot.state import LTInfo, SessionState, StateStore
 
@@ -21,6 +23,14 @@ def test_lt_info_is_complete_and_clear():
     assert lt.url is None
 
 
+def test_lt_info_str_lists_only_set_fields():
+    """LTInfo renders set fields only, or a placeholder when nothing is set."""
+    assert str(LTInfo()) == "LT情報は設定されていません"
+    assert str(LTInfo(speaker_name="山田", url="https://x")) == (
+        "発表者: 山田\nURL: https://x"
+    )
+
+
 def test_default_state_when_file_missing(tmp_path):
     """A missing state file yields default state."""
     store = StateStore(str(tmp_path / "absent.json"))
@@ -40,6 +50,7 @@ def test_save_and_reload_roundtrip(tmp_path):
     store.state.announce_message_id = 99887766
     store.state.confirm_message_id = 11223344
     store.state.target_event_date = datetime.date(2026, 6, 10)
+    store.state.command_tree_hash = "abc123"
     store.save()
 
     reloaded = StateStore(str(path))
@@ -50,6 +61,19 @@ def test_save_and_reload_roundtrip(tmp_path):
     assert reloaded.state.announce_message_id == 99887766
     assert reloaded.state.confirm_message_id == 11223344
     assert reloaded.state.target_event_date == datetime.date(2026, 6, 10)
+    assert reloaded.state.command_tree_hash == "abc123"
+
+
+@pytest.mark.asyncio
+async def test_save_async_persists_state(tmp_path):
+    """The async save writes the same content as the synchronous one."""
+    path = tmp_path / "state.json"
+    store = StateStore(str(path))
+    store.state.session_type = AnnouncementType.WORKSPACE
+
+    await store.save_async()
+
+    assert StateStore(str(path)).state.session_type == AnnouncementType.WORKSPACE
 
 
 def test_from_dict_falls_back_on_unknown_type():
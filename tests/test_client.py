@@ -7,7 +7,7 @@ import discord
 import pytest
 
 from bot.client import AnnounceBotClient
-from bot.constants import AnnouncementType, EnvKeys, ReactionEmoji
+from bot.constants import AnnouncementType, ConfigKeys, EnvKeys, ReactionEmoji
 from tests.conftest import make_member
 
 
@@ -37,6 +37,32 @@ def test_has_moderator_role(client):
     assert client._has_moderator_role(make_member("Member")) is False
 
 
+@pytest.mark.asyncio
+async def test_reaction_sees_updated_role_config(client):
+    """Changing the role keys takes effect on the next reaction."""
+    client.state.state.confirm_message_id = 12345
+    client.state.state.session_type = AnnouncementType.REGULAR
+    client.reannounce = AsyncMock()
+    assert client._has_moderator_role(make_member("Moderator")) is True
+
+    client.config.set_many(
+        ConfigKeys.SECTION_PERMISSIONS,
+        {ConfigKeys.KEY_ADMIN_ROLES: [], ConfigKeys.KEY_MODERATOR_ROLES: []},
+    )
+    await client.on_raw_reaction_add(
+        _payload(12345, ReactionEmoji.REST, make_member("Moderator"))
+    )
+    assert client.state.state.session_type == AnnouncementType.REGULAR
+
+    client.config.set(
+        ConfigKeys.SECTION_PERMISSIONS, ConfigKeys.KEY_MODERATOR_ROLES, ["Reviewer"]
+    )
+    await client.on_raw_reaction_add(
+        _payload(12345, ReactionEmoji.REST, make_member("Reviewer"))
+    )
+    assert client.state.state.session_type == AnnouncementType.REST
+
+
 @pytest.mark.asyncio
 async def test_reaction_updates_type_when_authorized(client):
     """A moderator reaction on the confirm message updates the weekly type."""
@@ -113,3 +139,47 @@ def test_action_role_mention_empty_when_role_absent(client):
     guild.roles = []
     assert client._action_role_mention(guild) == ""
     assert client._action_role_mention(None) == ""
+
+
+def test_message_content_intent_disabled(client):
+    """Slash-command-only bot does not subscribe to message content."""
+    assert client.intents.message_content is False
+    assert client.intents.reactions is True
+
+
+@pytest.mark.asyncio
+async def test_command_tree_sync_skipped_when_unchanged(client):
+    """The tree is synced once and skipped while definitions are unchanged."""
+    client.tree.sync = AsyncMock()
+
+    await client._sync_command_tree()
+    await client._sync_command_tree()
+
+    client.tree.sync.assert_awaited_once()
+    assert client.state.state.command_tree_hash is not None
+
+
+@pytest.mark.asyncio
+async def test_command_tree_sync_forced_by_env(client, monkeypatch):
+    """FORCE_COMMAND_SYNC syncs even when the definitions are unchanged."""
+    client.tree.sync = AsyncMock()
+    await client._sync_command_tree()
+
+    monkeypatch.setenv(EnvKeys.FORCE_COMMAND_SYNC, "1")
+    await client._sync_command_tree()
+
+    assert client.tree.sync.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_command_tree_resynced_after_definition_change(client):
+    """Adding commands changes the hash and triggers another sync."""
+    from bot.commands import UtilityCog
+
+    client.tree.sync = AsyncMock()
+    await client._sync_command_tree()
+
+    await client.add_cog(UtilityCog(client))
+    await client._sync_command_tree()
+
+    assert client.tree.sync.await_count == 2